@@ -3,6 +3,19 @@ from tkinter import messagebox, filedialog, colorchooser, scrolledtext
 import json
 from datetime import datetime
 import os
+import sys
+import gc
+import time
+import tracemalloc
+import argparse
+import tempfile
+
+import queue
+import heapq
+import zlib
+import colorsys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------- Appearance Setup ----------------
 ctk.set_appearance_mode("dark")
@@ -38,6 +51,10 @@ IMMUTABLE_TEXT = "white"
 # path for persistent notebook file
 DEFAULT_NOTEBOOK_PATH = "notebook.txt"
 
+# leaderboard only renders this many rows (plus the selected player when outside them);
+# a default lobby always fits completely
+LEADERBOARD_TOP_K = len(PLAYER_COLORS)
+
 # ---------------- Utilities ----------------
 def hex_to_rgb(hexcol: str):
     h = hexcol.lstrip("#")
@@ -51,6 +68,347 @@ def readable_text_color(hexcol: str):
     # return black or white depending on background luminance
     return "black" if luminance(hexcol) > 160 else "white"
 
+# these run on worker threads: keep them free of Tk calls
+def read_text_file(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def write_text_file(path: str, data: str):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data)
+    return path
+
+def read_json_file(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def write_json_file(path: str, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
+
+def rank_sus(names, scores, k, selected=None):
+    # nlargest is stable like sorted(), so ties keep roster order
+    top = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+    ranked = [(pos + 1, names[i], scores[i]) for pos, i in enumerate(top)]
+    extra = None
+    if selected is not None and selected in names and all(name != selected for _, name, _ in ranked):
+        idx = names.index(selected)
+        score = scores[idx]
+        # same position sorted() would give it, ties broken by roster order
+        extra = (1 + sum(1 for j, s in enumerate(scores) if s > score or (s == score and j < idx)), selected, score)
+
+    return ranked, extra
+
+# ---------------- Roster ----------------
+def default_player_color(name: str):
+    if name in PLAYER_COLORS:
+        return PLAYER_COLORS[name]
+    # stable hue per name so custom players keep their color across sessions
+    hue = zlib.crc32(name.encode("utf-8")) % 360 / 360.0
+    r, g, b = colorsys.hsv_to_rgb(hue, 0.65, 0.95)
+    return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+
+def parse_roster_text(text: str):
+    # one player per line, optionally followed by a #rrggbb color
+    entries = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        name, color = line, None
+        parts = line.rsplit(None, 1)
+        if len(parts) == 2 and parts[1].startswith("#") and len(parts[1]) == 7:
+            try:
+                hex_to_rgb(parts[1])
+                name, color = parts[0], parts[1].lower()
+            except ValueError:
+                pass
+        entries.append((name, color))
+    return entries
+
+class Roster:
+    # scores live in a C long array, which is 32-bit on Windows
+    MAX_SCORE = 2**31 - 1
+
+    def __init__(self, entries=()):
+        self.names = []
+        self.colors = []
+        self.index = {}
+        self._lower = []
+        # SUS lives in a flat array indexed like names, so ranking never touches a dict
+        self.scores = array("l")
+        for name, color in entries:
+            self.add(name, color)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def add(self, name, color=None):
+        if name in self.index:
+            return self.index[name]
+        self.index[name] = len(self.names)
+        self.names.append(name)
+        self._lower.append(name.lower())
+        self.colors.append(color or default_player_color(name))
+        self.scores.append(0)
+        return self.index[name]
+
+    def set_entries(self, entries):
+        # scores follow the player by name, so reordering or renaming others keeps them
+        old = self.sus_dict()
+        self.names, self.colors, self.index, self._lower = [], [], {}, []
+        self.scores = array("l")
+        for name, color in entries:
+            i = self.add(name, color)
+            self.scores[i] = old.get(name, 0)
+
+    def entries(self):
+        return [[name, color] for name, color in zip(self.names, self.colors)]
+
+    def color(self, name, default="#000000"):
+        i = self.index.get(name)
+        return self.colors[i] if i is not None else default
+
+    def score(self, name):
+        i = self.index.get(name)
+        return self.scores[i] if i is not None else 0
+
+    def bump(self, name, amount):
+        i = self.index.get(name)
+        if i is None:
+            return False
+        self.scores[i] = min(max(self.scores[i] + amount, 0), self.MAX_SCORE)
+        return True
+
+    def reset_scores(self):
+        self.scores = array("l", [0]) * len(self.names)
+
+    def sus_dict(self):
+        return dict(zip(self.names, self.scores))
+
+    def load_sus(self, sus):
+        # only players already on the roster; unknown names and bad values are skipped
+        for name, value in sus.items():
+            i = self.index.get(name)
+            if i is None:
+                continue
+            try:
+                self.scores[i] = min(max(int(value), 0), self.MAX_SCORE)
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+    def filter(self, text):
+        text = text.strip().lower()
+        if not text:
+            return list(self.names)
+        return [name for name, low in zip(self.names, self._lower) if text in low]
+
+# Only rows*columns buttons ever exist; scrolling and filtering just relabel them.
+class PlayerSelector(ctk.CTkFrame):
+    def __init__(self, master, app, rows=6, columns=2):
+        super().__init__(master, fg_color=IMMUTABLE_DARK_FRAME, corner_radius=8)
+        self.app = app
+        self.rows = rows
+        self.columns = columns
+        self.matches = []
+        self.first_row = 0
+
+        top = ctk.CTkFrame(self, fg_color="transparent")
+        top.pack(fill="x", padx=6, pady=(6,2))
+        self.filter_entry = ctk.CTkEntry(top, placeholder_text="Filter players")
+        self.filter_entry.pack(side="left", fill="x", expand=True)
+        self.filter_entry.bind("<KeyRelease>", lambda e: self.refilter())
+        self.filter_entry.bind("<Return>", self._select_first)
+        self.edit_btn = ctk.CTkButton(top, text="Edit", width=50, height=28, corner_radius=8, command=app.open_roster_editor)
+        self.edit_btn.pack(side="right", padx=(6,0))
+        app.register_colored(self.edit_btn)
+        self.count_label = ctk.CTkLabel(top, text="", width=56, anchor="e", text_color=IMMUTABLE_TEXT)
+        self.count_label.pack(side="right", padx=(6,0))
+
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=4, pady=(2,6))
+        self.slots = []
+        self._slot_state = []
+        for i in range(rows * columns):
+            btn = ctk.CTkButton(body, text="", width=135, height=35, corner_radius=10, hover_color="#3a3a3c",
+                                command=lambda i=i: self._on_slot(i))
+            btn.grid(row=i // columns, column=i % columns, padx=5, pady=5)
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                btn.bind(seq, self._on_wheel)
+            self.slots.append(btn)
+            self._slot_state.append(None)
+        self.scrollbar = ctk.CTkScrollbar(body, command=self._on_scroll)
+        self.scrollbar.grid(row=0, column=columns, rowspan=rows, sticky="ns", padx=(2,0))
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            body.bind(seq, self._on_wheel)
+
+        self.refilter()
+
+    def refilter(self, keep_position=False):
+        self.matches = self.app.roster.filter(self.filter_entry.get())
+        if not keep_position:
+            self.first_row = 0
+        self._scroll_to(self.first_row)
+
+    def set_font(self, font):
+        for btn in self.slots:
+            btn.configure(font=font)
+
+    def _total_rows(self):
+        return -(-len(self.matches) // self.columns)
+
+    def _scroll_to(self, first_row):
+        self.first_row = max(0, min(first_row, self._total_rows() - self.rows))
+        self.render()
+
+    def render(self):
+        roster = self.app.roster
+        selected = self.app.selected_player
+        for i, btn in enumerate(self.slots):
+            pos = self.first_row * self.columns + i
+            name = self.matches[pos] if pos < len(self.matches) else None
+            color = roster.color(name) if name is not None else None
+            state = (name, color, name is not None and name == selected)
+            # reconfiguring a CTkButton redraws it, so skip slots that already show this player
+            if state == self._slot_state[i]:
+                continue
+            self._slot_state[i] = state
+            if name is None:
+                btn.configure(text="", fg_color=IMMUTABLE_DARK_FRAME, hover_color=IMMUTABLE_DARK_FRAME, border_width=0, state="disabled")
+            else:
+                btn.configure(text=name, fg_color=color, hover_color="#3a3a3c", text_color=readable_text_color(color),
+                              border_width=2 if state[2] else 0, border_color=IMMUTABLE_TEXT, state="normal")
+        total = self._total_rows()
+        if total > self.rows:
+            self.scrollbar.set(self.first_row / total, (self.first_row + self.rows) / total)
+        else:
+            self.scrollbar.set(0, 1)
+        self.count_label.configure(text=f"{len(self.matches)}/{len(roster)}")
+
+    def _on_slot(self, i):
+        name = self._slot_state[i][0] if self._slot_state[i] else None
+        if name is not None:
+            self.app.select_player(name)
+
+    def _select_first(self, event=None):
+        if self.matches:
+            self.app.select_player(self.matches[0])
+
+    def _on_scroll(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(round(float(value) * self._total_rows())))
+        else:
+            step = int(float(value)) * (self.rows if unit == "pages" else 1)
+            self._scroll_to(self.first_row + step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self.first_row - 1)
+        else:
+            self._scroll_to(self.first_row + 1)
+
+# ---------------- Background Tasks ----------------
+# Workers only push finished futures onto a queue; the queue is drained with after()
+# so on_done/on_error always run on the Tk thread. A job submitted with a key
+# supersedes older jobs with the same key (cancelled if queued, result dropped if running).
+class TaskRunner:
+    def __init__(self, root, max_threads=4, poll_ms=30):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._threads = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="amogbook")
+        # single worker for jobs that must run in submission order, e.g. reads/writes of one file
+        self._serial = ThreadPoolExecutor(max_workers=1, thread_name_prefix="amogbook-serial")
+        self._results = queue.Queue()
+        self._generations = {}
+        self._futures = {}
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+
+    def submit(self, fn, *args, on_done=None, on_error=None, key=None, serial=False):
+        if self._closed:
+            return None
+        gen = 0
+        if key is not None:
+            self.cancel(key)
+            gen = self._generations[key]
+        future = (self._serial if serial else self._threads).submit(fn, *args)
+        if key is not None:
+            self._futures[key] = future
+        self._pending += 1
+        # done callbacks fire on the worker thread; only the queue is touched there
+        future.add_done_callback(lambda f: self._results.put((key, gen, f, on_done, on_error)))
+        self._schedule_poll()
+        return future
+
+    def cancel(self, key):
+        self._generations[key] = self._generations.get(key, 0) + 1
+        future = self._futures.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def is_busy(self):
+        return self._pending > 0
+
+    def _schedule_poll(self):
+        if self._poll_id is None and not self._closed:
+            self._poll_id = self.root.after(self.poll_ms, self._drain)
+
+    def _drain(self):
+        self._poll_id = None
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(item)
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def flush(self):
+        # blocks the Tk thread until every job (including ones queued by callbacks) has
+        # been delivered; meant for measurement, not for regular UI code
+        while self._pending > 0:
+            self._deliver(self._results.get())
+
+    def _deliver(self, item):
+        key, gen, future, on_done, on_error = item
+        self._pending -= 1
+        if key is not None and self._futures.get(key) is future:
+            del self._futures[key]
+        if future.cancelled():
+            return
+        if key is not None and self._generations.get(key) != gen:
+            return
+        exc = future.exception()
+        try:
+            if exc is not None:
+                if on_error:
+                    on_error(exc)
+            elif on_done:
+                on_done(future.result())
+        except Exception:
+            # same as an exception in any other Tk callback: report it, keep the loop alive
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def shutdown(self):
+        self._closed = True
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        # let queued writes finish; their results are simply never delivered
+        self._threads.shutdown(wait=True)
+        self._serial.shutdown(wait=True)
+
 # ---------------- Mini Overlay ----------------
 class MiniOverlay(ctk.CTkToplevel):
     def __init__(self, master, top_n=5):
@@ -79,6 +437,7 @@ class MiniOverlay(ctk.CTkToplevel):
         self.lines_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.lines_frame.pack(fill="both", expand=True, padx=6, pady=4)
 
+        self._update_id = None
         self.line_widgets = []
         for i in range(self.top_n):
             v_lbl = ctk.CTkLabel(self.lines_frame, text="", font=(self.font_family, self.base_font_size, "bold"), anchor="w", text_color=self.text_color)
@@ -109,14 +468,24 @@ class MiniOverlay(ctk.CTkToplevel):
                 location = entry.get("location", "Unknown")
                 nearby = entry.get("nearby", [])
                 time = entry.get("time", "")
-                color = PLAYER_COLORS.get(victim, "#000000")
+                color = self.master_app.roster.color(victim)
                 v_lbl.configure(text=f"#{entry.get('id','?')} {victim} — {time}", text_color=color, font=(self.font_family, self.base_font_size, "bold"))
                 nearby_text = ", ".join(nearby) if nearby else "None"
                 d_lbl.configure(text=f"Location: {location}  |  Nearby: {nearby_text}", text_color=self.text_color, font=(self.font_family, max(self.base_font_size - 1, 9)))
             else:
                 v_lbl.configure(text="")
                 d_lbl.configure(text="")
-        self.after(1000, self.update_overlay)
+        self._update_id = self.after(1000, self.update_overlay)
+
+    def destroy(self):
+        # otherwise the refresh loop keeps firing against a dead window
+        if self._update_id is not None:
+            try:
+                self.after_cancel(self._update_id)
+            except Exception:
+                pass
+            self._update_id = None
+        super().destroy()
 
 # ---------------- Notebook Window (persistent) ----------------
 class NotebookWindow(ctk.CTkToplevel):
@@ -135,7 +504,10 @@ class NotebookWindow(ctk.CTkToplevel):
         header = ctk.CTkLabel(self, text="Notebook", font=(master.font_family, max(master.base_font_size+2, 12), "bold"), text_color=master.text_color)
         header.pack(anchor="w", padx=10, pady=(8,6))
 
-        self.text_widget = scrolledtext.ScrolledText(self, wrap="word", undo=True)
+        # read-only until the file has been read, so nothing typed can be overwritten
+        # and an unfinished load can never be saved back over the notes
+        self.loaded = False
+        self.text_widget = scrolledtext.ScrolledText(self, wrap="word", undo=True, state="disabled")
         self.text_widget.pack(fill="both", expand=True, padx=10, pady=(0,10))
         try:
             self.text_widget.configure(font=(master.font_family, master.base_font_size))
@@ -145,28 +517,440 @@ class NotebookWindow(ctk.CTkToplevel):
         self.load_notes()
 
     def load_notes(self):
-        if os.path.exists(self.path):
-            try:
-                with open(self.path, "r", encoding="utf-8") as f:
-                    data = f.read()
+        # serial lane: queued behind any save of the same file from an earlier window
+        self.master.tasks.submit(read_text_file, self.path, on_done=self._show_notes, on_error=self._load_failed,
+                                 key="notes_load", serial=True)
+
+    def _show_notes(self, data):
+        if not self.winfo_exists():
+            return
+        try:
+            self.text_widget.configure(state="normal")
+            if data is not None:
                 self.text_widget.delete("1.0", "end")
                 self.text_widget.insert("1.0", data)
-            except Exception:
-                pass
+                self.text_widget.edit_reset()
+            self.loaded = True
+        except Exception:
+            pass
+
+    def _load_failed(self, exc):
+        if self.winfo_exists():
+            messagebox.showerror("Error", f"Failed to load notes: {exc}", parent=self)
 
     def save_notes(self):
+        if not self.loaded:
+            return
         try:
             data = self.text_widget.get("1.0", "end-1c")
-            with open(self.path, "w", encoding="utf-8") as f:
-                f.write(data)
         except Exception:
-            pass
+            return
+        self.master.tasks.submit(write_text_file, self.path, data, serial=True)
+
 
     def on_close(self):
         self.save_notes()
         self.destroy()
 
+# ---------------- Roster Editor ----------------
+class RosterWindow(ctk.CTkToplevel):
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Edit Roster")
+        self.geometry("420x560")
+        self.resizable(True, True)
+        self.app = master
+        try:
+            self.configure(fg_color=master.bg_color)
+        except Exception:
+            pass
+
+        header = ctk.CTkLabel(self, text="Roster — one player per line, optional #hex color", font=(master.font_family, max(master.base_font_size, 12), "bold"), text_color=master.text_color)
+        header.pack(anchor="w", padx=10, pady=(8,6))
+
+        self.text_widget = scrolledtext.ScrolledText(self, wrap="none", undo=True)
+        self.text_widget.pack(fill="both", expand=True, padx=10, pady=(0,6))
+        try:
+            self.text_widget.configure(font=(master.font_family, master.base_font_size))
+        except Exception:
+            pass
+        self.text_widget.insert("1.0", "\n".join(f"{name} {color}" for name, color in master.roster.entries()))
+
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(pady=(0,10))
+        ctk.CTkButton(btn_frame, text="Apply", command=self.apply).pack(side="left", padx=8)
+        ctk.CTkButton(btn_frame, text="Default Colors", command=self.reset_defaults).pack(side="left", padx=8)
+        ctk.CTkButton(btn_frame, text="Cancel", command=self.destroy).pack(side="right", padx=8)
+
+    def reset_defaults(self):
+        if messagebox.askyesno("Confirm", "Replace the roster with the default player colors?", parent=self):
+            self.text_widget.delete("1.0", "end")
+            self.text_widget.insert("1.0", "\n".join(f"{name} {color}" for name, color in PLAYER_COLORS.items()))
+
+    def apply(self):
+        entries = parse_roster_text(self.text_widget.get("1.0", "end-1c"))
+        if not entries:
+            messagebox.showwarning("Error", "The roster needs at least one player.", parent=self)
+            return
+        self.app.set_roster(entries)
+        self.destroy()
+
+# ---------------- Diagnostics ----------------
+def count_widgets(root):
+    counts = {}
+    stack = [root]
+    while stack:
+        w = stack.pop()
+        name = type(w).__name__
+        counts[name] = counts.get(name, 0) + 1
+        try:
+            stack.extend(w.winfo_children())
+        except Exception:
+            pass
+    return counts
+
+def pending_after_count(root):
+    try:
+        return len(root.tk.splitlist(root.tk.call("after", "info")))
+    except Exception:
+        return 0
+
+def _slope(xs, ys):
+    n = len(xs)
+    if n < 2:
+        return 0.0
+    mx = sum(xs) / n
+    my = sum(ys) / n
+    den = sum((x - mx) ** 2 for x in xs)
+    if den == 0:
+        return 0.0
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / den
+
+class MemoryDiagnostics:
+    def __init__(self, root, interval_ms=5000, top_n=10, frames=10):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.top_n = top_n
+        self.frames = frames
+        self.samples = []
+        self._baseline = None
+        self._final = None
+        self._after_id = None
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        gc.collect()
+        self._baseline = tracemalloc.take_snapshot()
+        self.sample()
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        self.sample()
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def sample(self):
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        widgets = count_widgets(self.root)
+        s = {
+            "t": time.monotonic(),
+            "traced": current,
+            "peak": peak,
+            "widgets": widgets,
+            "widget_total": sum(widgets.values()),
+            "after": pending_after_count(self.root)
+        }
+        self.samples.append(s)
+        return s
+
+    def stop(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if tracemalloc.is_tracing():
+            gc.collect()
+            self._final = tracemalloc.take_snapshot()
+
+    def top_allocations(self):
+        if self._baseline is None:
+            return []
+        snapshot = self._final or tracemalloc.take_snapshot()
+        skip = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+        stats = snapshot.filter_traces(skip).compare_to(self._baseline.filter_traces(skip), "lineno")
+        return stats[:self.top_n]
+
+    def report(self):
+        if not self.samples:
+            return "No diagnostics samples were taken."
+        first, last = self.samples[0], self.samples[-1]
+        # trends are per minute so short and long runs read the same way
+        minutes = [(s["t"] - first["t"]) / 60.0 for s in self.samples]
+        lines = [f"Memory diagnostics: {len(self.samples)} samples over {last['t'] - first['t']:.1f}s"]
+        lines.append(
+            f"  traced memory: {first['traced'] / 1024:.1f} KiB -> {last['traced'] / 1024:.1f} KiB"
+            f" (trend {_slope(minutes, [s['traced'] / 1024 for s in self.samples]):+.1f} KiB/min, peak {last['peak'] / 1024:.1f} KiB)"
+        )
+        lines.append(
+            f"  live widgets: {first['widget_total']} -> {last['widget_total']}"
+            f" (trend {_slope(minutes, [s['widget_total'] for s in self.samples]):+.1f}/min)"
+        )
+        for name in sorted(set(first["widgets"]) | set(last["widgets"])):
+            delta = last["widgets"].get(name, 0) - first["widgets"].get(name, 0)
+            if delta:
+                lines.append(f"    {name}: {first['widgets'].get(name, 0)} -> {last['widgets'].get(name, 0)} ({delta:+d})")
+        lines.append(f"  pending after callbacks: {first['after']} -> {last['after']}")
+        lines.append("  top allocation sites since start:")
+        for stat in self.top_allocations():
+            lines.append(f"    {stat}")
+        return "\n".join(lines)
+
+# scripted add/delete/select/load cycles for checking that memory stays flat
+class SoakRun:
+    def __init__(self, app, cycles=2000, sample_every=200, on_finish=None):
+        self.app = app
+        self.cycles = cycles
+        self.sample_every = sample_every
+        self.on_finish = on_finish
+        self.done = 0
+        if app.diagnostics is None:
+            app.diagnostics = MemoryDiagnostics(app)
+            app.diagnostics.start()
+        self.diagnostics = app.diagnostics
+        players = app.players
+        # load cycles read this file through the same background path as load_session
+        fd, self.session_path = tempfile.mkstemp(prefix="amogbook-soak-", suffix=".json")
+        os.close(fd)
+        write_json_file(self.session_path, {
+            "sus": {p: 0 for p in players},
+            "bodies": [
+                {"id": i + 1, "victim": players[i % len(players)], "location": "Soak", "nearby": players[:3], "notes": "", "time": "00:00:00"}
+                for i in range(20)
+            ],
+            "next_id": 21
+        })
+
+    def start(self):
+        self.app.after(1, self._step)
+
+    def _step(self):
+        app = self.app
+        i = self.done
+        player = app.players[i % len(app.players)]
+        app.select_player(player)
+        app.change_sus(1 if i % 2 == 0 else -1)
+        app.victim.set(player)
+        app.location.insert(0, "Soak")
+        app.nearby.insert(0, ", ".join(app.players[:2]))
+        app.add_body()
+        if app.bodies:
+            app.remove_entry(app.bodies[0])
+        if i % 50 == 0:
+            app.tasks.submit(read_json_file, self.session_path, on_done=app._apply_session, key="load_session")
+        if i % 100 == 0:
+            app.open_mini_overlay()
+            app.mini_overlay.destroy()
+        self.done += 1
+        if self.done % self.sample_every == 0:
+            self.diagnostics.sample()
+        if self.done < self.cycles:
+            app.after(1, self._step)
+        else:
+            app.after(1, self._finish)
+
+    def _finish(self):
+        # wait for queued session loads so the last sample is settled
+        if self.app.tasks.is_busy():
+            self.app.after(20, self._finish)
+            return
+        try:
+            os.remove(self.session_path)
+        except OSError:
+            pass
+        self.diagnostics.sample()
+        print(f"Soak run finished: {self.done} cycles")
+        if self.on_finish:
+            self.on_finish()
+        else:
+            print(self.diagnostics.report())
+
+# ---------------- Record / Replay ----------------
+# Log format: a JSON header line holding the starting session, then one compact
+# JSON array per action: [seconds since start (monotonic), action, *args].
+REPLAY_LOG_VERSION = 1
+
+def read_replay_log(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    if not lines:
+        raise ValueError(f"{path} is empty")
+    header = json.loads(lines[0])
+    if header.get("version") != REPLAY_LOG_VERSION:
+        raise ValueError(f"Unsupported replay log version: {header.get('version')}")
+    return header, [json.loads(line) for line in lines[1:]]
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+# Lines are appended and flushed as they happen, so a crash or force-quit keeps
+# everything up to the last action. A single writer thread keeps them in order.
+class ActionRecorder:
+    def __init__(self, app, path):
+        self.app = app
+        self.path = path
+        self.start_t = time.monotonic()
+        self._file = open(path, "w", encoding="utf-8")
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="amogbook-recorder")
+        self._write(json.dumps({
+            "version": REPLAY_LOG_VERSION,
+            "recorded": datetime.now().isoformat(timespec="seconds"),
+            "state": app.session_data()
+        }, ensure_ascii=False))
+
+    def _write(self, line):
+        self._writer.submit(self._append, line)
+
+    def _append(self, line):
+        self._file.write(line + "\n")
+        self._file.flush()
+
+    def record(self, action, *args):
+        t = round(time.monotonic() - self.start_t, 4)
+        self._write(json.dumps([t, action, *args], ensure_ascii=False, separators=(",", ":")))
+
+    def stop(self):
+        self._writer.submit(self._file.close)
+        self._writer.shutdown(wait=True)
+
+# Feeds a recorded log back into the app. Latency is measured from dispatching an
+# action until every background job it queued has been delivered and Tk is idle.
+class ActionReplayer:
+    def __init__(self, app, path, realtime=False, on_finish=None):
+        self.app = app
+        self.path = path
+        self.realtime = realtime
+        self.on_finish = on_finish
+        self.actions = []
+        self.latencies = {}
+        self.errors = {}
+        self.index = 0
+
+    def start(self):
+        self.app.tasks.submit(read_replay_log, self.path, on_done=self._begin, on_error=self._fail)
+
+    def _fail(self, exc):
+        print(f"Replay failed: {exc}")
+        if self.on_finish:
+            self.on_finish()
+
+    def _begin(self, log):
+        header, self.actions = log
+        self.app._apply_session(header.get("state", {}))
+        self.start_t = time.monotonic()
+        self._schedule_next()
+
+    def _schedule_next(self):
+        if self.index >= len(self.actions):
+            self._finish()
+            return
+        delay = 0
+        if self.realtime:
+            delay = max(0, int((self.start_t + self.actions[self.index][0] - time.monotonic()) * 1000))
+        self.app.after(delay, self._run_action)
+
+    def _run_action(self):
+        _, name, *args = self.actions[self.index]
+        handler = getattr(self, f"_do_{name}", None)
+        started = time.perf_counter()
+        try:
+            if handler is None:
+                raise ValueError(f"unknown action {name!r}")
+            handler(*args)
+            # deliver queued results right away instead of waiting for the poll
+            self.app.tasks.flush()
+            self.app.update_idletasks()
+        except Exception as e:
+            self.errors[name] = self.errors.get(name, 0) + 1
+            print(f"Replay action #{self.index + 1} {name} failed: {e}")
+        else:
+            self.latencies.setdefault(name, []).append(time.perf_counter() - started)
+        self.index += 1
+        self._schedule_next()
+
+    def _finish(self):
+        print(self.report())
+        if self.on_finish:
+            self.on_finish()
+
+    def report(self):
+        total = sum(len(v) for v in self.latencies.values())
+        mode = "realtime" if self.realtime else "fast"
+        lines = [f"Replay of {total} actions from {self.path} ({mode})"]
+        lines.append(f"  {'action':<18}{'count':>7}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+        for name in sorted(self.latencies):
+            values = sorted(v * 1000 for v in self.latencies[name])
+            lines.append(
+                f"  {name:<18}{len(values):>7}{sum(values) / len(values):>10.2f}"
+                f"{_percentile(values, 50):>10.2f}{_percentile(values, 95):>10.2f}{values[-1]:>10.2f}"
+            )
+        for name, count in sorted(self.errors.items()):
+            lines.append(f"  {name}: {count} failed")
+        return "\n".join(lines)
+
+    # replay handlers skip confirmation dialogs but otherwise take the same paths as the UI
+    def _do_select_player(self, name):
+        self.app.select_player(name)
+
+    def _do_change_sus(self, amount):
+        self.app.change_sus(amount)
+
+    def _do_reset_sus(self):
+        self.app.clear_sus()
+
+    def _do_add_body(self, victim, location, nearby_text, notes):
+        app = self.app
+        app.victim.set(victim)
+        for widget, value in ((app.location, location), (app.nearby, nearby_text), (app.notes, notes)):
+            widget.delete(0, "end")
+            widget.insert(0, value)
+        app.add_body()
+
+    def _do_delete_entry(self, entry_id, position):
+        # ids can repeat in loaded sessions, so the position decides and the id confirms it
+        bodies = self.app.bodies
+        if not 0 <= position < len(bodies) or bodies[position].get("id") != entry_id:
+            raise ValueError(f"body #{entry_id} is not at position {position}")
+        self.app.remove_entry(bodies[position])
+
+    def _do_apply_settings(self, bg, font, font_size_text):
+        self.app._apply_settings_values(bg, font, font_size_text)
+
+    def _do_apply_font(self, font_family, font_size, text_color, alpha):
+        self.app._apply_font_choice(font_family, font_size, text_color, alpha)
+
+    def _do_settings_color(self, hex_color):
+        self.app._apply_settings_color(hex_color)
+
+    def _do_load_session(self, data):
+        self.app._apply_session(data)
+
+    def _do_set_roster(self, entries):
+        self.app.set_roster([tuple(e) for e in entries])
+
+    def _do_open_notebook(self):
+        self.app.open_notebook()
+
+    def _do_open_mini_overlay(self):
+        self.app.open_mini_overlay()
+
 # ---------------- Main App ----------------
+
 class AmongUsApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -181,16 +965,24 @@ class AmongUsApp(ctk.CTk):
         self.text_color = IMMUTABLE_TEXT
         self.font_alpha = 255
 
-        self.players = list(PLAYER_COLORS.keys())
-        self.sus = {p: 0 for p in self.players}
+        self.roster = Roster(PLAYER_COLORS.items())
         self.bodies = []
         self.next_id = 1
         self.selected_player = None
         self.mini_overlay = None
         self.notebook_window = None
+        self.roster_window = None
+        self.diagnostics = None
+        self.recorder = None
+        self.tasks = TaskRunner(self)
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # track buttons that should follow player color
         self.colored_buttons = []
+        # id(entry) -> log card, so cards can be dropped without walking the log frame;
+        # keyed by object rather than body id since loaded sessions may repeat ids
+        self.entry_cards = {}
 
         self.available_fonts = [
             "Arial", "Calibri", "Helvetica", "Times New Roman", "Courier New",
@@ -206,34 +998,19 @@ class AmongUsApp(ctk.CTk):
         self.build_sidebar()
         self.build_main()
 
+    @property
+    def players(self):
+        return self.roster.names
+
     # ---------------- Sidebar ----------------
     def build_sidebar(self):
         ctk.CTkLabel(self.sidebar, text="Players", font=(self.font_family, 20, "bold"), text_color=self.text_color).pack(pady=10)
 
         self.player_selector_outer = ctk.CTkFrame(self.sidebar, fg_color=IMMUTABLE_DARK_BG, corner_radius=10)
         self.player_selector_outer.pack(padx=6, pady=5, fill="x")
-        player_inner = ctk.CTkFrame(self.player_selector_outer, fg_color=IMMUTABLE_DARK_FRAME, corner_radius=8)
-        player_inner.pack(padx=6, pady=6, fill="both")
-
-        grid = ctk.CTkScrollableFrame(player_inner, width=320, height=260, fg_color=IMMUTABLE_DARK_FRAME)
-        grid.pack(fill="both", expand=True)
-        self.player_buttons = {}
-        for i, (name, color) in enumerate(PLAYER_COLORS.items()):
-            btn = ctk.CTkButton(
-                grid,
-                text=name,
-                fg_color=color,
-                hover_color="#3a3a3c",
-                text_color="black" if name not in ["Black", "Maroon", "Gray", "Brown"] else "white",
-                width=120,
-                height=35,
-                corner_radius=10,
-                command=lambda n=name: self.select_player(n)
-            )
-            btn.grid(row=i//2, column=i%2, padx=5, pady=5)
-            self.player_buttons[name] = btn
-            # player swatch buttons are colored by design; include them so they keep their own color
-            # do not add to self.colored_buttons (they already show their color)
+        # player swatch buttons are colored by design; they are not in self.colored_buttons
+        self.player_selector = PlayerSelector(self.player_selector_outer, self)
+        self.player_selector.pack(padx=6, pady=6, fill="both")
 
         info_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
         info_frame.pack(pady=8, fill="x", padx=6)
@@ -286,6 +1063,23 @@ class AmongUsApp(ctk.CTk):
         self.sus_container.pack(pady=5)
         self.sus_inner = ctk.CTkFrame(self.sus_container, fg_color=IMMUTABLE_DARK_FRAME, corner_radius=6)
         self.sus_inner.pack(fill="both", expand=True, padx=6, pady=6)
+        header_frame = ctk.CTkFrame(self.sus_inner, fg_color="transparent")
+        header_frame.pack(fill="x", padx=6, pady=(4,2))
+        ctk.CTkLabel(header_frame, text="Color", width=60, anchor="w", font=(self.font_family, 11, "bold"), text_color=IMMUTABLE_TEXT).pack(side="left")
+        ctk.CTkLabel(header_frame, text="Player", anchor="w", font=(self.font_family, 11, "bold"), text_color=IMMUTABLE_TEXT).pack(side="left", padx=(8,0))
+        ctk.CTkLabel(header_frame, text="SUS", anchor="e", font=(self.font_family, 11, "bold"), text_color=IMMUTABLE_TEXT).pack(side="right")
+        # fixed pool of rows that get relabelled, instead of rebuilding widgets on every change
+        self.sus_rows = []
+        for _ in range(LEADERBOARD_TOP_K + 1):
+            row = ctk.CTkFrame(self.sus_inner, fg_color="transparent")
+            swatch = ctk.CTkLabel(row, text="", width=22, height=18, corner_radius=4)
+            swatch.pack(side="left", padx=(0,8))
+            pname = ctk.CTkLabel(row, text="", anchor="w", font=(self.font_family, 11), text_color=IMMUTABLE_TEXT)
+            pname.pack(side="left", padx=(0,10))
+            score_lbl = ctk.CTkLabel(row, text="", anchor="e", font=(self.font_family, 11), text_color=IMMUTABLE_TEXT)
+            score_lbl.pack(side="right")
+            self.sus_rows.append((row, swatch, pname, score_lbl))
+        self.sus_rows_visible = 0
         self.refresh_sus_display()
 
         # Appearance settings
@@ -323,7 +1117,9 @@ class AmongUsApp(ctk.CTk):
         form = ctk.CTkFrame(self.main, fg_color="transparent")
         form.pack(pady=10)
 
-        self.victim = ctk.CTkOptionMenu(form, values=self.players)
+        # a combobox so victims can be typed when the roster is too long for a menu
+        self.victim = ctk.CTkComboBox(form, values=list(self.players))
+        self.victim.set(self.players[0] if self.players else "")
         self.victim.grid(row=0,column=0,padx=5,pady=5)
         self.location = ctk.CTkEntry(form, placeholder_text="Body location (e.g., Electrical)")
         self.location.grid(row=0,column=1,padx=5,pady=5)
@@ -346,6 +1142,12 @@ class AmongUsApp(ctk.CTk):
         if btn not in self.colored_buttons:
             self.colored_buttons.append(btn)
 
+    def unregister_colored(self, btn):
+        try:
+            self.colored_buttons.remove(btn)
+        except ValueError:
+            pass
+
     def apply_player_color(self, color_hex):
         if not color_hex:
             return
@@ -420,17 +1222,8 @@ class AmongUsApp(ctk.CTk):
         update_preview()
 
         def apply_font_choice():
-            chosen_font = font_var.get()
-            chosen_size = int(size_var.get())
-            if chosen_size > 40:
-                chosen_size = 40
             a = a_var.get(); r = r_var.get(); g = g_var.get(); b = b_var.get()
-            hex_rgb = f"#{r:02x}{g:02x}{b:02x}"
-            self.font_family = chosen_font
-            self.base_font_size = chosen_size
-            self.text_color = hex_rgb
-            self.font_alpha = int(a)
-            self._apply_font_to_widgets()
+            self._apply_font_choice(font_var.get(), int(size_var.get()), f"#{r:02x}{g:02x}{b:02x}", int(a))
             win.destroy()
 
         btn_frame = ctk.CTkFrame(win, fg_color="transparent")
@@ -438,6 +1231,14 @@ class AmongUsApp(ctk.CTk):
         ctk.CTkButton(btn_frame, text="Apply", command=apply_font_choice).pack(side="left", padx=8)
         ctk.CTkButton(btn_frame, text="Cancel", command=win.destroy).pack(side="right", padx=8)
 
+    def _apply_font_choice(self, font_family, font_size, text_color, alpha):
+        self._record("apply_font", font_family, font_size, text_color, alpha)
+        self.font_family = font_family
+        self.base_font_size = min(font_size, 40)
+        self.text_color = text_color
+        self.font_alpha = alpha
+        self._apply_font_to_widgets()
+
     # ---------------- Apply fonts/colors globally (skip immutable backgrounds) ----------------
     def _apply_font_to_widgets(self):
         try:
@@ -474,11 +1275,10 @@ class AmongUsApp(ctk.CTk):
             except Exception:
                 pass
 
-        for name, btn in getattr(self, "player_buttons", {}).items():
-            try:
-                btn.configure(font=(self.font_family, self.base_font_size))
-            except Exception:
-                pass
+        try:
+            self.player_selector.set_font((self.font_family, self.base_font_size))
+        except Exception:
+            pass
 
         if self.mini_overlay and self.mini_overlay.winfo_exists():
             try:
@@ -491,55 +1291,83 @@ class AmongUsApp(ctk.CTk):
 
     # ---------------- Logic: selection and SUS ----------------
     def select_player(self, name):
+        self._record("select_player", name)
         self.selected_player = name
-        self.selected_label.configure(text=f"Selected: {name}", text_color=PLAYER_COLORS.get(name, "#000000"), font=(self.font_family, self.base_font_size, "italic"))
+        self.selected_label.configure(text=f"Selected: {name}", text_color=self.roster.color(name), font=(self.font_family, self.base_font_size, "italic"))
         # apply player color to all registered buttons
-        color = PLAYER_COLORS.get(name, None)
+        color = self.roster.color(name, None)
         if color:
             self.apply_player_color(color)
+        self.player_selector.render()
+        self.refresh_sus_display()
 
     def change_sus(self, amount):
         if self.selected_player:
-            self.sus[self.selected_player] += amount
-            if self.sus[self.selected_player] < 0:
-                self.sus[self.selected_player] = 0
+            self._record("change_sus", amount)
+            self.roster.bump(self.selected_player, amount)
             self.refresh_sus_display()
 
     def reset_sus(self):
         if messagebox.askyesno("Confirm", "Reset all SUS values?"):
-            for p in self.sus:
-                self.sus[p] = 0
-            self.refresh_sus_display()
+            self.clear_sus()
+
+    def clear_sus(self):
+        self._record("reset_sus")
+        self.roster.reset_scores()
+        self.refresh_sus_display()
 
     def refresh_sus_display(self):
-        for child in self.sus_inner.winfo_children():
-            child.destroy()
-        header_frame = ctk.CTkFrame(self.sus_inner, fg_color="transparent")
-        header_frame.pack(fill="x", padx=6, pady=(4,2))
-        ctk.CTkLabel(header_frame, text="Color", width=60, anchor="w", font=(self.font_family, 11, "bold"), text_color=IMMUTABLE_TEXT).pack(side="left")
-        ctk.CTkLabel(header_frame, text="Player", anchor="w", font=(self.font_family, 11, "bold"), text_color=IMMUTABLE_TEXT).pack(side="left", padx=(8,0))
-        ctk.CTkLabel(header_frame, text="SUS", anchor="e", font=(self.font_family, 11, "bold"), text_color=IMMUTABLE_TEXT).pack(side="right")
-        sorted_sus = sorted(self.sus.items(), key=lambda x: x[1], reverse=True)
-        for name, score in sorted_sus:
-            row = ctk.CTkFrame(self.sus_inner, fg_color="transparent")
-            row.pack(fill="x", padx=6, pady=3)
-            swatch = ctk.CTkLabel(row, text="", width=22, height=18, corner_radius=4)
-            swatch.configure(fg_color=PLAYER_COLORS.get(name, "#ffffff"))
-            swatch.pack(side="left", padx=(0,8))
-            pname = ctk.CTkLabel(row, text=name, anchor="w", font=(self.font_family, 11), text_color=IMMUTABLE_TEXT)
-            pname.pack(side="left", padx=(0,10))
-            score_lbl = ctk.CTkLabel(row, text=str(score), anchor="e", font=(self.font_family, 11), text_color=IMMUTABLE_TEXT)
-            score_lbl.pack(side="right")
+        # top-K ranking is well under a millisecond even for big rosters; a worker
+        # round trip would only add the poll delay to every click
+        self._render_sus(rank_sus(self.roster.names, self.roster.scores, LEADERBOARD_TOP_K, self.selected_player))
+
+    def _render_sus(self, result):
+        ranked, extra = result
+        rows = ranked + [extra] if extra else ranked
+        for i, (rank, name, score) in enumerate(rows):
+            row, swatch, pname, score_lbl = self.sus_rows[i]
+            weight = "bold" if name == self.selected_player else "normal"
+            swatch.configure(fg_color=self.roster.color(name, "#ffffff"))
+            pname.configure(text=f"{rank}. {name}", font=(self.font_family, 11, weight))
+            score_lbl.configure(text=str(score), font=(self.font_family, 11, weight))
+        # visible rows are always a prefix of the pool, so re-packing in order keeps the layout
+        for i in range(self.sus_rows_visible, len(rows)):
+            self.sus_rows[i][0].pack(fill="x", padx=6, pady=3)
+        for i in range(len(rows), self.sus_rows_visible):
+            self.sus_rows[i][0].pack_forget()
+        self.sus_rows_visible = len(rows)
+
+    # ---------------- Roster ----------------
+    def open_roster_editor(self):
+        if self.roster_window and self.roster_window.winfo_exists():
+            self.roster_window.lift()
+            return
+        self.roster_window = RosterWindow(self)
+
+    def set_roster(self, entries):
+        self._record("set_roster", [list(e) for e in entries])
+        self.roster.set_entries(entries)
+        self._roster_changed()
+
+    def _roster_changed(self):
+        if self.selected_player not in self.roster:
+            self.selected_player = None
+            self.selected_label.configure(text="No player selected", text_color=self.text_color)
+        self.victim.configure(values=list(self.players))
+        self.player_selector.refilter(keep_position=True)
+        self.refresh_sus_display()
 
     # ---------------- Bodies management ----------------
     def add_body(self):
         victim = self.victim.get().strip()
         location = self.location.get().strip()
-        nearby = [n.strip() for n in self.nearby.get().split(",") if n.strip()]
+        nearby_text = self.nearby.get()
+        nearby = [n.strip() for n in nearby_text.split(",") if n.strip()]
         notes = self.notes.get().strip()
         if not victim or not location:
             messagebox.showwarning("Error", "Please specify at least victim and location.")
             return
+        self._record("add_body", victim, location, nearby_text, notes)
         entry = {
             "id": self.next_id,
             "victim": victim,
@@ -551,8 +1379,7 @@ class AmongUsApp(ctk.CTk):
         self.bodies.insert(0, entry)
         self.next_id += 1
         for n in nearby:
-            if n in self.sus:
-                self.sus[n] += 1
+            self.roster.bump(n, 1)
         self.refresh_sus_display()
         self.add_log_entry_ui(entry)
         self.location.delete(0, "end")
@@ -564,25 +1391,44 @@ class AmongUsApp(ctk.CTk):
         card.pack(fill="x", padx=8, pady=6)
         header = ctk.CTkLabel(card, text=f"#{entry['id']} {entry['victim']} — {entry['time']}",
                               font=(self.font_family, max(self.base_font_size + 2, 12), "bold"),
-                              text_color=PLAYER_COLORS.get(entry['victim'], IMMUTABLE_TEXT))
+                              text_color=self.roster.color(entry['victim'], IMMUTABLE_TEXT))
         header.grid(row=0, column=0, sticky="w", padx=8, pady=(6,2))
-        del_btn = ctk.CTkButton(card, text="Delete", width=80, command=lambda e=entry, f=card: self.delete_entry(e, f))
+        del_btn = ctk.CTkButton(card, text="Delete", width=80, command=lambda e=entry: self.delete_entry(e))
         del_btn.grid(row=0, column=1, sticky="e", padx=8, pady=(6,2))
         self.register_colored(del_btn)
         details = f"Location: {entry['location']}  |  Nearby: {', '.join(entry['nearby']) if entry['nearby'] else 'None'}\nNotes: {entry['notes']}"
         lbl = ctk.CTkLabel(card, text=details, font=(self.font_family, self.base_font_size), wraplength=800, justify="left", text_color=self.text_color)
         lbl.grid(row=1, column=0, columnspan=2, sticky="w", padx=8, pady=(0,8))
+        card.del_btn = del_btn
+        self.entry_cards[id(entry)] = card
+        return card
 
-    def delete_entry(self, entry, frame_widget):
+    def _destroy_card(self, card):
+        self.unregister_colored(card.del_btn)
+        card.destroy()
+
+    def delete_entry(self, entry):
         if messagebox.askyesno("Confirm", f"Delete entry #{entry['id']}?"):
-            try:
-                self.bodies.remove(entry)
-            except ValueError:
-                pass
-            frame_widget.destroy()
+            if self.recorder:
+                # by identity: equal-looking duplicate bodies must not match
+                position = next((i for i, b in enumerate(self.bodies) if b is entry), -1)
+                self._record("delete_entry", entry['id'], position)
+            self.remove_entry(entry)
+
+
+    def remove_entry(self, entry):
+        try:
+            self.bodies.remove(entry)
+        except ValueError:
+            pass
+        card = self.entry_cards.pop(id(entry), None)
+
+        if card is not None:
+            self._destroy_card(card)
 
     # ---------------- Notebook ----------------
     def open_notebook(self):
+        self._record("open_notebook")
         if self.notebook_window and self.notebook_window.winfo_exists():
             self.notebook_window.lift()
             return
@@ -603,48 +1449,53 @@ class AmongUsApp(ctk.CTk):
         hex_color = color[1]
         self.bg_entry.delete(0, "end")
         self.bg_entry.insert(0, hex_color)
+        if not self._apply_settings_color(hex_color):
+            messagebox.showwarning("Warning", "Color applied but some widgets may not support the chosen color.")
+
+    def _apply_settings_color(self, hex_color):
+        self._record("settings_color", hex_color)
         try:
-            self.bg_color = hex_color
-            self.sidebar.configure(fg_color=self.bg_color)
-            self.main.configure(fg_color=self.bg_color)
-            self.player_selector_outer.configure(fg_color=IMMUTABLE_DARK_BG)
-            try:
-                for child in self.player_selector_outer.winfo_children():
-                    child.configure(fg_color=IMMUTABLE_DARK_FRAME)
-            except Exception:
-                pass
-            self.sus_controls_frame.configure(fg_color=IMMUTABLE_DARK_BG)
-            self.sus_inner.configure(fg_color=IMMUTABLE_DARK_FRAME)
-            if hasattr(self, "log_outer"):
-                self.log_outer.configure(fg_color=IMMUTABLE_DARK_BG)
-                self.log_frame.configure(fg_color=IMMUTABLE_DARK_FRAME)
+            self._set_bg_color(hex_color)
+            ok = True
         except Exception:
-            messagebox.showwarning("Warning", "Color applied but some widgets may not support the chosen color.")
+            ok = False
         self.refresh_sus_display()
         self._apply_font_to_widgets()
+        return ok
+
+    def _set_bg_color(self, hex_color):
+        # only the outer frames follow the GUI color; the immutable sections are re-darkened
+        self.bg_color = hex_color
+        self.sidebar.configure(fg_color=self.bg_color)
+        self.main.configure(fg_color=self.bg_color)
+        self.player_selector_outer.configure(fg_color=IMMUTABLE_DARK_BG)
+        try:
+            for child in self.player_selector_outer.winfo_children():
+                child.configure(fg_color=IMMUTABLE_DARK_FRAME)
+        except Exception:
+            pass
+        self.sus_controls_frame.configure(fg_color=IMMUTABLE_DARK_BG)
+        self.sus_inner.configure(fg_color=IMMUTABLE_DARK_FRAME)
+        if hasattr(self, "log_outer"):
+            self.log_outer.configure(fg_color=IMMUTABLE_DARK_BG)
+            self.log_frame.configure(fg_color=IMMUTABLE_DARK_FRAME)
 
     def apply_settings(self):
         bg = self.bg_entry.get().strip()
         font = self.font_entry.get().strip()
         font_size_text = self.font_size_entry.get().strip()
+        for warning in self._apply_settings_values(bg, font, font_size_text):
+            messagebox.showwarning("Warning", warning)
+        messagebox.showinfo("Applied", "Appearance settings applied.")
+
+    def _apply_settings_values(self, bg, font, font_size_text):
+        self._record("apply_settings", bg, font, font_size_text)
+        warnings = []
         if bg:
             try:
-                self.bg_color = bg
-                self.sidebar.configure(fg_color=self.bg_color)
-                self.main.configure(fg_color=self.bg_color)
-                self.player_selector_outer.configure(fg_color=IMMUTABLE_DARK_BG)
-                try:
-                    for child in self.player_selector_outer.winfo_children():
-                        child.configure(fg_color=IMMUTABLE_DARK_FRAME)
-                except Exception:
-                    pass
-                self.sus_controls_frame.configure(fg_color=IMMUTABLE_DARK_BG)
-                self.sus_inner.configure(fg_color=IMMUTABLE_DARK_FRAME)
-                if hasattr(self, "log_outer"):
-                    self.log_outer.configure(fg_color=IMMUTABLE_DARK_BG)
-                    self.log_frame.configure(fg_color=IMMUTABLE_DARK_FRAME)
+                self._set_bg_color(bg)
             except Exception:
-                messagebox.showwarning("Warning", "Invalid background color value. Use a valid hex like #ffffff.")
+                warnings.append("Invalid background color value. Use a valid hex like #ffffff.")
         if font:
             self.font_family = font
         if font_size_text:
@@ -656,15 +1507,17 @@ class AmongUsApp(ctk.CTk):
                     fs = 6
                 self.base_font_size = fs
             except ValueError:
-                messagebox.showwarning("Warning", "Font size must be an integer.")
+                warnings.append("Font size must be an integer.")
         self._apply_font_to_widgets()
-        messagebox.showinfo("Applied", "Appearance settings applied.")
+        return warnings
 
     # ---------------- Save / Load ----------------
-    def save_session(self):
-        data = {
-            "sus": self.sus,
-            "bodies": self.bodies,
+    def session_data(self):
+        # snapshot so a worker never sees the lists change under it
+        return {
+            "roster": self.roster.entries(),
+            "sus": self.roster.sus_dict(),
+            "bodies": list(self.bodies),
             "next_id": self.next_id,
             "settings": {
                 "bg_color": self.bg_color,
@@ -674,27 +1527,43 @@ class AmongUsApp(ctk.CTk):
                 "font_alpha": self.font_alpha
             }
         }
+
+    def save_session(self):
+        data = self.session_data()
         path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
         if path:
-            try:
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                messagebox.showinfo("Saved", f"Session saved to {path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save session: {e}")
+            self.tasks.submit(
+                write_json_file, path, data,
+                on_done=lambda p: messagebox.showinfo("Saved", f"Session saved to {p}"),
+                on_error=lambda e: messagebox.showerror("Error", f"Failed to save session: {e}")
+            )
 
     def load_session(self):
         path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if not path:
             return
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load file: {e}")
-            return
+        self.tasks.submit(
+            read_json_file, path,
+            on_done=self._on_session_loaded,
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to load file: {e}"),
+            key="load_session"
+        )
+
+    def _on_session_loaded(self, data):
+        self._record("load_session", data)
+        self._apply_session(data)
+        messagebox.showinfo("Loaded", "Session loaded successfully.")
+
+    def _apply_session(self, data):
+        if "roster" in data and isinstance(data["roster"], list):
+            self.roster.set_entries([(e[0], e[1] if len(e) > 1 else None) for e in data["roster"] if e])
+        elif "sus" in data and isinstance(data["sus"], dict):
+            # sessions saved before rosters existed: the sus keys are the player list
+            self.roster.set_entries([(name, self.roster.color(name, None)) for name in data["sus"]])
         if "sus" in data and isinstance(data["sus"], dict):
-            self.sus = {k: int(v) for k, v in data["sus"].items()}
+            self.roster.reset_scores()
+            self.roster.load_sus(data["sus"])
+        self._roster_changed()
         if "bodies" in data and isinstance(data["bodies"], list):
             self.bodies = data["bodies"]
         if "next_id" in data:
@@ -703,42 +1572,65 @@ class AmongUsApp(ctk.CTk):
             except Exception:
                 pass
         settings = data.get("settings", {})
-        self.bg_color = settings.get("bg_color", self.bg_color)
         self.font_family = settings.get("font_family", self.font_family)
         self.base_font_size = settings.get("base_font_size", self.base_font_size)
         self.text_color = settings.get("text_color", self.text_color)
         self.font_alpha = settings.get("font_alpha", self.font_alpha)
         try:
-            self.sidebar.configure(fg_color=self.bg_color)
-            self.main.configure(fg_color=self.bg_color)
-            self.player_selector_outer.configure(fg_color=IMMUTABLE_DARK_BG)
-            try:
-                for child in self.player_selector_outer.winfo_children():
-                    child.configure(fg_color=IMMUTABLE_DARK_FRAME)
-            except Exception:
-                pass
-            self.sus_controls_frame.configure(fg_color=IMMUTABLE_DARK_BG)
-            self.sus_inner.configure(fg_color=IMMUTABLE_DARK_FRAME)
-            if hasattr(self, "log_outer"):
-                self.log_outer.configure(fg_color=IMMUTABLE_DARK_BG)
-                self.log_frame.configure(fg_color=IMMUTABLE_DARK_FRAME)
+            self._set_bg_color(settings.get("bg_color", self.bg_color))
         except Exception:
             pass
         self.refresh_sus_display()
-        for child in self.log_frame.winfo_children():
-            child.destroy()
+        for card in self.entry_cards.values():
+            self._destroy_card(card)
+        self.entry_cards = {}
         for entry in list(self.bodies):
             self.add_log_entry_ui(entry)
         self._apply_font_to_widgets()
-        messagebox.showinfo("Loaded", "Session loaded successfully.")
 
     def open_mini_overlay(self):
+        self._record("open_mini_overlay")
         if self.mini_overlay and self.mini_overlay.winfo_exists():
             self.mini_overlay.lift()
             return
         self.mini_overlay = MiniOverlay(self, top_n=5)
 
+    def _record(self, action, *args):
+        if self.recorder:
+            self.recorder.record(action, *args)
+
+    def on_close(self):
+        if self.notebook_window and self.notebook_window.winfo_exists():
+            self.notebook_window.save_notes()
+        if self.recorder:
+            self.recorder.stop()
+            self.recorder = None
+        self.tasks.shutdown()
+        if self.diagnostics:
+            self.diagnostics.stop()
+            print(self.diagnostics.report())
+            self.diagnostics = None
+        self.destroy()
+
 # ---------------- Run App ----------------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AmogBook+ body notebook")
+    parser.add_argument("--diagnostics", action="store_true", help="sample memory, widget and after() counts; report on exit")
+    parser.add_argument("--diag-interval", type=float, default=5.0, help="seconds between diagnostics samples")
+    parser.add_argument("--soak", type=int, default=0, metavar="CYCLES", help="run scripted add/delete/select/load cycles, report and exit")
+    parser.add_argument("--record", metavar="LOG", help="record every UI action to LOG for later replay")
+    parser.add_argument("--replay", metavar="LOG", help="replay a recorded LOG, report per-action latency and exit")
+    parser.add_argument("--realtime", action="store_true", help="replay with the recorded timing instead of as fast as possible")
+    args = parser.parse_args()
+
     app = AmongUsApp()
+    if args.diagnostics or args.soak:
+        app.diagnostics = MemoryDiagnostics(app, interval_ms=int(args.diag_interval * 1000))
+        app.diagnostics.start()
+    if args.record:
+        app.recorder = ActionRecorder(app, args.record)
+    if args.soak:
+        SoakRun(app, cycles=args.soak, on_finish=app.on_close).start()
+    elif args.replay:
+        ActionReplayer(app, args.replay, realtime=args.realtime, on_finish=app.on_close).start()
     app.mainloop()